@@ -4,12 +4,12 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.shadowroot import ShadowRoot
-from selenium.common.exceptions import TimeoutException, NoSuchFrameException
-from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException, NoSuchFrameException, NoSuchElementException
 import selenium.webdriver.chrome.webdriver as chrome
 import selenium.webdriver.firefox.webdriver as firefox
 import selenium.webdriver.edge.webdriver as edge
 from selenium.webdriver.chrome.options import Options as chromeOptions
+from .support.wait_profile import WaitProfile
 from typing import Any
 import time
 
@@ -47,21 +47,56 @@ class Driver:
         
         self.wait_time: int = 6
         self.driver_wait: WebDriverWait = WebDriverWait(self.driver, self.wait_time)
-        self.action_driver: ActionChains = ActionChains(self.driver)
+        self.wait_profile: WaitProfile | None = None
         
     def set_wait_timer(self, value: float | int = 6) -> None:
         '''Sets the wait timer for `WebDriverWait` to a given value. 
         Setting the wait timer will effect the time it takes to look for an element.
 
+        If a `WaitProfile` is set, its ceiling is also set to this value. A `ValueError` is raised
+        if the value is smaller than the `min_timeout` of the profile.
+
         Parameters
         -----------
             value: float | int, default `6`
                 The given wait time.
         '''
+        # validated by the profile before anything changes.
+        if self.wait_profile is not None:
+            self.wait_profile.set_ceiling(value)
+
         self.wait_time = value
 
         self.driver_wait = WebDriverWait(self.driver, self.wait_time)
     
+    def set_wait_profile(self, profile: WaitProfile | str | None = None) -> None:
+        '''Enables adaptive waits for `presence_find_element` using a `WaitProfile`.
+
+        With a profile set, each locator is polled quickly at first and backs off over time, and its
+        timeout is derived from how long it took to appear previously. If the element is not found
+        within that timeout, a `TimeoutException` exception is raised and the miss is recorded, so
+        repeated misses raise the timeout up to the profile ceiling. The profile is saved on `quit`
+        if it has a path.
+
+        The ceiling of the profile always follows `wait_time`: it is set to `wait_time` when the profile
+        is set, and `set_wait_timer` updates it afterwards. Use `set_wait_timer` to change the ceiling.
+
+        Parameters
+        ----------
+            profile: WaitProfile | str | None, default `None`
+                A `WaitProfile` or a path to a profile file. If a path is given, a `WaitProfile` is created
+                with the default settings. By default it is `None`, which disables adaptive waits.
+        '''
+        if isinstance(profile, str):
+            profile = WaitProfile(profile, ceiling=self.wait_time)
+        elif profile is not None and not isinstance(profile, WaitProfile):
+            raise TypeError(f'Expected profile to be type WaitProfile or str, got {type(profile)}')
+
+        if profile is not None:
+            profile.set_ceiling(self.wait_time)
+
+        self.wait_profile = profile
+
     def go_to(self, url: str) -> None:
         '''Sends the driver to a URL.'''
         if not isinstance(url, str):
@@ -170,6 +205,9 @@ class Driver:
         if locator is None or value is None:
             raise TypeError
 
+        if self.wait_profile is not None:
+            return self._adaptive_find_element(locator, value)
+
         ele = self.driver_wait.until(EC.presence_of_element_located(
             (locator, value)
         ))
@@ -311,10 +349,44 @@ class Driver:
         
         return element
     
+    def _adaptive_find_element(self, locator: str | By, value: str) -> WebElement:
+        '''Return a `WebElement` using the timeout and poll intervals of `wait_profile`, and record
+        the time it took to appear. If no element is found, a `TimeoutException` exception is raised.
+
+        A miss is recorded with `WaitProfile.record_miss`, which raises the learned timeout of a
+        locator that keeps missing instead of failing at the same timeout on every call.'''
+        timeout = self.wait_profile.timeout(locator, value)
+        start = time.monotonic()
+        deadline = start + timeout
+
+        for interval in self.wait_profile.poll_intervals():
+            try:
+                ele = self.driver.find_element(locator, value)
+            except NoSuchElementException:
+                pass
+            else:
+                self.wait_profile.record(locator, value, time.monotonic() - start)
+
+                return ele
+
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                self.wait_profile.record_miss(locator, value, timeout)
+
+                raise TimeoutException(f'Element ({locator}, {value}) not found after {timeout} seconds')
+
+            time.sleep(min(interval, remaining))
+
     def _execute_js(self, js: str, *args: Any) -> WebElement:
         '''Execute JavaScript in the current window.'''
         return self.driver.execute_script(js, *args)
     
     def quit(self):
         '''Terminate the session.'''
-        self.driver.quit()
\ No newline at end of file
+        try:
+            if self.wait_profile is not None and self.wait_profile.path is not None:
+                self.wait_profile.save()
+        finally:
+            # a failed save must not leave the browser running.
+            self.driver.quit()
\ No newline at end of file
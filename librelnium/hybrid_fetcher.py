@@ -0,0 +1,350 @@
+from selenium.webdriver.common.by import By
+from urllib.parse import urlparse
+from .scraper import Scraper
+from .support.utils import is_list_tuple
+import copy
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from requests.cookies import RequestsCookieJar, create_cookie
+    from lxml import html as lxml_html
+    from lxml.etree import ParserError
+except ImportError:
+    # names used in annotations are defined so the module imports, __init__ raises the ImportError.
+    requests = None
+    lxml_html = None
+    HTTPAdapter = RequestsCookieJar = create_cookie = ParserError = None
+
+try:
+    import cssselect
+except ImportError:
+    cssselect = None
+
+# elements that are never part of the visible text of a page.
+_NON_TEXT_TAGS = ('script', 'style', 'noscript', 'template', 'head')
+# boolean attributes, Selenium returns 'true' if present and None if not.
+_BOOLEAN_ATTRIBUTES = {'checked', 'selected', 'disabled', 'readonly', 'required', 'multiple', 'hidden'}
+
+class HybridFetcher(Scraper):
+    '''Class to extract data from pages with a plain HTTP request, using the browser only when needed.
+
+    Server rendered pages do not need a full browser render. The page is fetched with a pooled HTTP
+    session that reuses the cookies of the browser, and the locators are evaluated against the parsed
+    HTML. If the request fails, a locator does not match, or the site requires JavaScript, the
+    browser is used instead.
+
+    Values from the HTTP path are made to match Selenium where possible: URL attributes (e.g. `href`)
+    are absolute, `value` is read from `<textarea>` and `<select>`, boolean attributes return `'true'`,
+    and text excludes `<script>`/`<style>` and elements hidden with `hidden` or an inline `display: none`.
+    Styles from CSS files are not applied, so text hidden by a stylesheet is still included, and
+    whitespace is collapsed to single spaces instead of following the rendered layout.
+
+    This class requires the `requests`, `lxml` and `cssselect` packages.
+    '''
+    def __init__(self, driver, *, js_hosts: list[str] = None, pool_size: int = 10):
+        '''
+        Parameters
+        ----------
+            driver: WebDriver
+                Any WebDriver. It is used for cookies and when a page needs the browser.
+
+            js_hosts: list[str], default `None`
+                A list of host names that always require the browser. Subdomains of a host
+                also match, e.g. `example.com` matches `app.example.com`.
+
+            pool_size: int, default `10`
+                The maximum number of pooled connections for each host.
+        '''
+        if requests is None or lxml_html is None or cssselect is None:
+            raise ImportError('HybridFetcher requires the packages requests, lxml and cssselect')
+
+        super().__init__(driver)
+
+        self.js_hosts: set[str] = set(js_hosts) if js_hosts is not None else set()
+
+        self.session: requests.Session = requests.Session()
+        # browser cookies are kept apart from the session, they are filtered by host for each request.
+        self.browser_cookies: list[dict] = []
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = self._execute_js('return navigator.userAgent;')
+
+    def require_js(self, host: str) -> None:
+        '''Adds a host that always requires the browser.'''
+        if not isinstance(host, str):
+            raise TypeError(f'Expected host to be type str, got {type(host)}')
+
+        self.js_hosts.add(host)
+
+    def sync_cookies(self) -> None:
+        '''Copies the cookies of the browser into the HTTP session. It is called before every fetch.
+
+        Chromium based browsers (Chrome, Edge) copy the cookies of every domain. Other browsers only
+        expose the cookies of the domain the browser is currently on, so a fetch to a different host
+        does not get its cookies until the browser has visited that host.
+        '''
+        cookies = None
+
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            try:
+                cookies = self.driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+            except Exception:
+                cookies = None
+
+        if cookies is None:
+            cookies = self.driver.get_cookies()
+
+        self.browser_cookies = cookies
+
+    def fetch_elements(self,
+                       url: str,
+                       locators: list[tuple[str, str] | str] | tuple[tuple[str, str] | str, ...],
+                       *,
+                       attribute: str = None) -> list[str]:
+        '''Returns the text or attribute of every element matching the last locator on a page.
+
+        The locators follow the same rules as `get_elements`. If no element matches over HTTP,
+        the page is loaded in the browser and `get_elements` is used.
+
+        Parameters
+        ----------
+            url: str
+                The URL of the page.
+
+            locators: list[tuple[str,str] | str]
+                A list of locators, see `get_elements`.
+
+            attribute: str, default `None`
+                The HTML attribute to get from each element. By default the text of the elements is returned.
+        '''
+        tree = self._fetch_html(url)
+
+        if tree is not None:
+            elements = self._html_find_elements(tree, locators)
+
+            if len(elements) > 0:
+                return [self._html_value(element, attribute) for element in elements]
+
+        self.go_to(url)
+
+        # get_elements removes items from the list it is given.
+        web_elements = self.get_elements(list(locators))
+
+        return [element.text if attribute is None else element.get_attribute(attribute) for element in web_elements]
+
+    def fetch_attribute(self,
+                        url: str,
+                        html_elements: list[str],
+                        *,
+                        locator: str | By = By.ID,
+                        attribute: str = 'value') -> str:
+        '''Get the attribute of an HTML element on a page.
+
+        The arguments follow the same rules as `get_element_attribute`. If the element is not found
+        over HTTP, the page is loaded in the browser and `get_element_attribute` is used.
+
+        Parameters
+        ----------
+            url: str
+                The URL of the page.
+
+            html_elements: list[str]
+                A list of HTML elements, see `get_element_attribute`.
+
+            locator: str | By, default 'id'
+                The locator used to search for the element. By default it searches by ID.
+
+            attribute: str, default 'value'
+                The HTML attribute to get the value from. By default is retrieves the `value` attribute.
+        '''
+        if len(html_elements) == 0:
+            raise ValueError('Cannot have an empty list for html_elements')
+
+        tree = self._fetch_html(url)
+
+        if tree is not None:
+            element = tree
+
+            for html_element in html_elements:
+                matches = self._html_select(element, locator, html_element)
+
+                if len(matches) == 0:
+                    element = None
+                    break
+
+                element = matches[0]
+
+            if element is not None:
+                return self._html_value(element, attribute)
+
+        self.go_to(url)
+
+        return self.get_element_attribute(html_elements, locator=locator, attribute=attribute)
+
+    def _fetch_html(self, url: str):
+        '''Returns the parsed HTML of a page. If the page requires the browser or the request fails,
+        None is returned.'''
+        if not isinstance(url, str):
+            raise TypeError(f'Expected url to be type str but got {type(url)}')
+
+        host = urlparse(url).hostname or ''
+
+        if any(host == js_host or host.endswith('.' + js_host) for js_host in self.js_hosts):
+            return None
+
+        self.sync_cookies()
+
+        try:
+            response = self.session.get(url, cookies=self._cookies_for(host), timeout=self.wait_time)
+        except requests.RequestException:
+            return None
+
+        if not response.ok or 'html' not in response.headers.get('Content-Type', ''):
+            return None
+
+        try:
+            tree = lxml_html.document_fromstring(response.content, base_url=response.url)
+        except ParserError:
+            # an empty body, the browser may still render something.
+            return None
+
+        # Selenium returns the resolved URL for attributes such as href and src.
+        tree.make_links_absolute(resolve_base_href=True, handle_failures='ignore')
+
+        return tree
+
+    def _cookies_for(self, host: str) -> RequestsCookieJar:
+        '''Returns the browser cookies that are sent to a host.
+
+        A cookie with a leading dot in its domain is sent to the domain and its subdomains,
+        otherwise the cookie is host-only and the host must match exactly.
+        '''
+        jar = RequestsCookieJar()
+
+        for cookie in self.browser_cookies:
+            domain: str = cookie.get('domain', '')
+
+            if domain.startswith('.'):
+                if host != domain[1:] and not host.endswith(domain):
+                    continue
+            elif host != domain:
+                continue
+
+            # Selenium uses 'expiry', DevTools uses 'expires' with -1 for session cookies.
+            expires = cookie.get('expiry', cookie.get('expires'))
+            expires = int(expires) if expires is not None and expires >= 0 else None
+
+            # the domain is set to the host, the cookie is already matched to it.
+            jar.set_cookie(create_cookie(
+                cookie['name'],
+                cookie['value'],
+                domain=host,
+                path=cookie.get('path', '/'),
+                secure=bool(cookie.get('secure', False)),
+                expires=expires,
+                discard=expires is None
+            ))
+
+        return jar
+
+    def _html_find_elements(self, tree, locators: list[tuple[str, str] | str] | tuple[tuple[str, str] | str, ...]) -> list:
+        '''Returns the parsed HTML elements matching the last locator, following the rules of `get_elements`.'''
+        if not is_list_tuple(locators[0]):
+            raise ValueError(f'Got unexpected type {type(locators[0])}, expected type list or tuple.')
+
+        strategy, locator = locators[0]
+        elements = self._html_select(tree, strategy, locator)
+
+        for item in locators[1:]:
+            if len(elements) == 0:
+                break
+
+            if isinstance(item, tuple):
+                strategy, locator = item
+            elif isinstance(item, str):
+                locator = item
+            else:
+                raise TypeError(f'Expected item to be of type str or tuple, but got {type(item)}')
+
+            elements = self._html_select(elements[0], strategy, locator)
+
+        return elements
+
+    def _html_select(self, element, strategy: str | By, locator: str) -> list:
+        '''Returns the parsed HTML elements under an element matching a Selenium locator strategy.'''
+        if strategy == By.XPATH:
+            matches = element.xpath(locator)
+        elif strategy == By.CSS_SELECTOR:
+            matches = element.cssselect(locator)
+        elif strategy == By.ID:
+            matches = element.xpath('.//*[@id=$value]', value=locator)
+        elif strategy == By.NAME:
+            matches = element.xpath('.//*[@name=$value]', value=locator)
+        elif strategy == By.CLASS_NAME:
+            matches = element.xpath(
+                './/*[contains(concat(" ", normalize-space(@class), " "), $value)]', value=f' {locator} '
+            )
+        elif strategy == By.TAG_NAME:
+            matches = element.iter(locator)
+        elif strategy == By.LINK_TEXT:
+            matches = element.xpath('.//a[normalize-space()=$value]', value=locator.strip())
+        elif strategy == By.PARTIAL_LINK_TEXT:
+            matches = element.xpath('.//a[contains(., $value)]', value=locator)
+        else:
+            raise ValueError(f'Got unexpected locator strategy {strategy}')
+
+        # xpath can return strings or numbers, only elements are kept.
+        return [match for match in matches if isinstance(match, lxml_html.HtmlElement) and match is not element]
+
+    def _html_value(self, element, attribute: str = None) -> str | None:
+        '''Returns the attribute of a parsed HTML element, or its text if no attribute is given.
+
+        The values follow Selenium's `text` and `get_attribute` where the HTML allows it,
+        see the class docstring for the differences.
+        '''
+        if attribute is None:
+            return self._html_text(element)
+
+        attribute = attribute.lower()
+
+        if attribute in _BOOLEAN_ATTRIBUTES:
+            return 'true' if element.get(attribute) is not None else None
+
+        if attribute == 'value':
+            if element.tag == 'textarea':
+                return element.text or ''
+
+            if element.tag == 'select':
+                options = element.xpath('.//option')
+                selected = [option for option in options if option.get('selected') is not None]
+                option = (selected or options or [None])[0]
+
+                if option is None:
+                    return ''
+
+                return option.get('value', self._html_text(option))
+
+            if element.tag == 'input':
+                return element.get('value', '')
+
+        return element.get(attribute)
+
+    def _html_text(self, element) -> str:
+        '''Returns the text of a parsed HTML element without scripts, styles and hidden elements.'''
+        element = copy.deepcopy(element)
+
+        hidden = element.xpath(
+            'descendant-or-self::*[@hidden or contains(translate(@style, " ", ""), "display:none")]'
+        )
+
+        if element in hidden:
+            return ''
+
+        for child in hidden + [i for i in element.iter(*_NON_TEXT_TAGS) if i is not element]:
+            # drop_tree keeps the tail text, which belongs to the parent.
+            if child.getparent() is not None:
+                child.drop_tree()
+
+        return ' '.join(element.text_content().split())
@@ -1,7 +1,9 @@
 from .driver import Driver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from .support.utils import is_list_tuple
 
 class Scraper(Driver):
@@ -176,13 +178,124 @@ class Scraper(Driver):
 
             search_val: str | WebElement
                 The value that is the dragged element. A string or WebElement can be used.
-                If a string is given, a search on the page for the string returns a WebElement.
+                If a string is given, the element is found with `search_text`, which searches
+                the page for an element containing the text (**case sensitive**).
         '''       
+        element = self._resolve_drag_element(search_val)
+        drag_to_element = self.presence_find_element(locator, drag_to)
+
+        # a new chain is built per call, a reused chain keeps every action queued before.
+        action = ActionChains(self.driver)
+        action.click_and_hold(element).pause(.3)
+
+        # the pause is necessary to wait for JS to update the new card location.
+        action.move_to_element(drag_to_element).release(drag_to_element).pause(.8)
+        action.perform()
+
+    def drag_many(self,
+                  moves: list[tuple[str | WebElement, str | WebElement]],
+                  locator: str | By = By.XPATH,
+                  *,
+                  batch: bool = False,
+                  timeout: float | int = None) -> None:
+        '''Drags multiple elements to their desired locations on a page.
+
+        Unlike `drag`, no fixed pauses are used. Each drop is confirmed by waiting for the DOM
+        to change: the dragged element is moved under a new parent, moved to a new position in
+        the same parent, or replaced (stale). If a drop is not detected within `timeout`, a
+        `TimeoutException` exception is raised.
+
+        A move is skipped if the TARGET already contains the SOURCE, as there is no change to detect.
+
+        The same interactability rules of `drag` apply to every element in `moves`.
+
+        Parameters
+        ----------
+            moves: list[tuple[str | WebElement, str | WebElement]]
+                A list of tuples in the order of (SOURCE, TARGET). The SOURCE follows the rules of
+                `search_val` in `drag`, the TARGET can be a WebElement or a string searched with `locator`.
+
+            locator: str | By
+                The locator strategy used to search for TARGET strings.
+                By default it uses the By.XPATH strategy.
+
+            batch: bool, default `False`
+                If `True`, every move is queued into a single action sequence and performed at once,
+                with the drops confirmed afterwards. This is faster but only works on pages that
+                can handle back to back drags without waiting on their JS. By default each move is
+                performed and confirmed before the next one starts.
+
+                Earlier moves in a batch shift the positions of other elements, so a batched drop
+                is only confirmed by a change of parent. Reordering within the same parent is not
+                supported with `batch` and raises a `ValueError`.
+
+            timeout: float | int, default `None`
+                The maximum time to wait for a drop to be detected. By default it uses `wait_time`.
+        '''
+        if not is_list_tuple(moves):
+            raise TypeError(f'Expected moves to be type list or tuple, got type {type(moves)}')
+
+        if timeout is None:
+            timeout = self.wait_time
+
+        drop_wait = WebDriverWait(self.driver, timeout, poll_frequency=.05)
+        batch_action = ActionChains(self.driver) if batch else None
+        pending: list[tuple[WebElement, WebElement, int]] = []
+
+        for move in moves:
+            if not is_list_tuple(move) or len(move) != 2:
+                raise ValueError(f'Expected a (source, target) pair in moves, got {move}')
+
+            source, target = move
+            element = self._resolve_drag_element(source)
+
+            if isinstance(target, WebElement):
+                drag_to_element = target
+            else:
+                drag_to_element = self.presence_find_element(locator, target)
+
+            # parameters: element, target. returns [targetContainsElement, parentContainsTarget, parent, index].
+            contained, reorder, parent, index = self._execute_js(
+                '''const parent = arguments[0].parentElement;
+                return [
+                    arguments[1].contains(arguments[0]),
+                    parent !== null && parent.contains(arguments[1]),
+                    parent,
+                    parent === null ? -1 : Array.prototype.indexOf.call(parent.children, arguments[0])
+                ];''',
+                element,
+                drag_to_element
+            )
+
+            if contained:
+                continue
+
+            if batch and reorder:
+                raise ValueError(f'Cannot confirm a reorder within the same parent in a batch, got {move}')
+
+            action = batch_action if batch else ActionChains(self.driver)
+            action.click_and_hold(element).move_to_element(drag_to_element).release(drag_to_element)
+
+            if batch:
+                # the index is not compared, earlier moves in the batch can change it.
+                pending.append((element, parent, None))
+            else:
+                action.perform()
+                drop_wait.until(self._drop_detected(element, parent, index))
+
+        if batch and len(pending) > 0:
+            batch_action.perform()
+
+            for element, parent, index in pending:
+                drop_wait.until(self._drop_detected(element, parent, index))
+
+    def _resolve_drag_element(self, search_val: str | WebElement) -> WebElement:
+        '''Returns the WebElement to drag. If a string is given, the page is searched for the text.'''
         if search_val is None:
             raise ValueError(f'Expected a type str or type WebElement for search_val')
         
         if isinstance(search_val, str):
-            element = self.get_element(search_val)
+            element = self.search_text(search_val)
 
             if element is None:
                 raise ValueError(f'Could not find {search_val}')
@@ -190,14 +303,33 @@ class Scraper(Driver):
             element = search_val
         else:
             raise TypeError(f'Expected type str or WebElement for search_val, got type {type(search_val)}')
+        
+        return element
 
-        drag_to_element = self.presence_find_element(locator, drag_to)
-
-        self.action_driver.click_and_hold(element).pause(.3)
+    def _drop_detected(self, element: WebElement, parent: WebElement, index: int | None):
+        '''Returns a condition for `WebDriverWait` that is True once a dragged element has
+        been dropped.
 
-        # the pause is necessary to wait for JS to update the new card location.
-        self.action_driver.move_to_element(drag_to_element).release(drag_to_element).pause(.8)
-        self.action_driver.perform()
+        A drop is detected if the element has a different parent or a different index in its parent
+        than before the drag, or was removed from the DOM (some libraries replace the dragged node).
+        If `index` is None, only the parent is compared.
+        '''
+        def _condition(_) -> bool:
+            try:
+                # parameters: element, parent, index
+                return self._execute_js(
+                    '''const parent = arguments[0].parentElement;
+                    return parent !== arguments[1]
+                        || (arguments[2] !== null
+                            && Array.prototype.indexOf.call(parent.children, arguments[0]) !== arguments[2]);''',
+                    element,
+                    parent,
+                    index
+                )
+            except StaleElementReferenceException:
+                return True
+
+        return _condition
 
     def _traverse_locators(self,
                         strategy: str, 
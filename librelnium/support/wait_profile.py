@@ -0,0 +1,129 @@
+from pathlib import Path
+import json
+import math
+
+class WaitProfile:
+    '''Records how long locators take to appear and derives wait timeouts from them.'''
+    def __init__(self,
+                 path: str | Path = None,
+                 *,
+                 ceiling: float | int = 6,
+                 percentile: float = .95,
+                 margin: float | int = 2,
+                 min_timeout: float | int = .5,
+                 max_samples: int = 50):
+        '''
+        Parameters
+        ----------
+            path: str | Path, default `None`
+                A JSON file used to load and save the learned latencies. If the file exists it is
+                loaded on creation. By default the profile is only kept in memory.
+
+            ceiling: float | int, default `6`
+                The maximum timeout that can be returned. Locators without any samples use this value.
+
+            percentile: float, default `.95`
+                The percentile of the observed latencies used as the base of the timeout.
+
+            margin: float | int, default `2`
+                The multiplier applied to the percentile latency to allow for slower page loads.
+
+            min_timeout: float | int, default `.5`
+                The minimum timeout that can be returned.
+
+            max_samples: int, default `50`
+                The number of recent samples kept for each locator.
+        '''
+        if not 0 < percentile <= 1:
+            raise ValueError(f'Expected percentile to be between 0 and 1, got {percentile}')
+
+        if max_samples < 1:
+            raise ValueError(f'Expected max_samples to be at least 1, got {max_samples}')
+
+        self.path: Path | None = Path(path) if path is not None else None
+        self.percentile: float = percentile
+        self.margin: float | int = margin
+        self.min_timeout: float | int = min_timeout
+        self.max_samples: int = max_samples
+
+        self.ceiling: float | int = ceiling
+        self.set_ceiling(ceiling)
+
+        self.samples: dict[str, list[float]] = {}
+
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    def set_ceiling(self, value: float | int) -> None:
+        '''Sets the maximum timeout. It cannot be smaller than `min_timeout`.'''
+        if self.min_timeout > value:
+            raise ValueError(f'min_timeout {self.min_timeout} cannot be larger than ceiling {value}')
+
+        self.ceiling = value
+
+    def record(self, locator: str, value: str, latency: float) -> None:
+        '''Record the time in seconds it took for a locator to appear.'''
+        samples = self.samples.setdefault(self._key(locator, value), [])
+        samples.append(latency)
+
+        if len(samples) > self.max_samples:
+            del samples[:len(samples) - self.max_samples]
+
+    def record_miss(self, locator: str, value: str, timeout: float | int) -> None:
+        '''Record that a locator did not appear within `timeout` seconds.
+
+        The miss is recorded as a sample of `timeout`, the latency was at least that long.
+        Once misses reach the percentile, the returned timeout is `timeout * margin`, so
+        consecutive misses keep raising it up to the ceiling.
+        '''
+        self.record(locator, value, timeout)
+
+    def timeout(self, locator: str, value: str) -> float | int:
+        '''Returns the timeout for a locator. If the locator has no samples, the ceiling is returned.'''
+        samples = self.samples.get(self._key(locator, value))
+
+        if not samples:
+            return self.ceiling
+
+        ordered = sorted(samples)
+        # nearest-rank percentile
+        rank = max(math.ceil(self.percentile * len(ordered)) - 1, 0)
+
+        return min(max(ordered[rank] * self.margin, self.min_timeout), self.ceiling)
+
+    def poll_intervals(self, start: float = .01, factor: float = 1.5, limit: float = .5):
+        '''Yields poll intervals in seconds, starting fast and backing off up to `limit`.'''
+        interval = start
+
+        while True:
+            yield interval
+
+            interval = min(interval * factor, limit)
+
+    def load(self) -> None:
+        '''Loads the samples from the profile path.'''
+        if self.path is None:
+            raise ValueError('Cannot load a profile without a path')
+
+        with open(self.path, 'r') as file:
+            data: dict[str, list[float]] = json.load(file)
+
+        self.samples = {key: [float(i) for i in values][-self.max_samples:] for key, values in data.items()}
+
+    def save(self) -> None:
+        '''Saves the samples to the profile path.'''
+        if self.path is None:
+            raise ValueError('Cannot save a profile without a path')
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first so an interrupted save does not corrupt the profile.
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+
+        with open(tmp_path, 'w') as file:
+            json.dump(self.samples, file)
+
+        tmp_path.replace(self.path)
+
+    def _key(self, locator: str, value: str) -> str:
+        return f'{locator}|{value}'
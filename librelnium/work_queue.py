@@ -0,0 +1,282 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple
+from contextlib import contextmanager
+import threading
+import sqlite3
+import json
+import time
+import socket
+import uuid
+import os
+
+class Task(NamedTuple):
+    '''A leased task from a `WorkQueue`.'''
+    id: int
+    payload: Any
+    lease_id: str
+    attempts: int
+
+class WorkQueue(ABC):
+    '''Base class for a queue shared by multiple workers.
+
+    Tasks are leased to a worker for a limited time. A worker keeps its lease alive with `heartbeat`,
+    and a task whose lease expires (e.g. the worker died) is given to the next worker that calls `take`.
+    '''
+    @abstractmethod
+    def put(self, payloads: Iterable[Any]) -> int:
+        '''Adds payloads to the queue and returns the number added. Payloads already in the queue are ignored.'''
+
+    @abstractmethod
+    def take(self, worker_id: str) -> Task | None:
+        '''Leases the next available task to a worker. If no task is available, None is returned.'''
+
+    @abstractmethod
+    def heartbeat(self, task: Task) -> bool:
+        '''Extends the lease of a task. Returns False if the lease was lost.'''
+
+    @abstractmethod
+    def complete(self, task: Task, result: Any = None) -> bool:
+        '''Stores the result of a task. Returns False if the task was completed by another lease.'''
+
+    @abstractmethod
+    def fail(self, task: Task, error: str = None) -> None:
+        '''Releases a task after an error, so it can be retried or marked as failed.'''
+
+    @abstractmethod
+    def progress(self) -> dict[str, int]:
+        '''Returns the number of tasks for each status.'''
+
+    @abstractmethod
+    def results(self) -> list[tuple[Any, Any]]:
+        '''Returns a list of (PAYLOAD, RESULT) tuples of the completed tasks.'''
+
+class SQLiteQueue(WorkQueue):
+    '''A `WorkQueue` backed by a local SQLite file.
+
+    Any number of processes on the same machine can share the file. SQLite locking is not
+    reliable on network file systems, for workers on multiple hosts use another `WorkQueue`.
+    '''
+    def __init__(self, path: str | Path, *, lease_time: float | int = 60, max_attempts: int = 3):
+        '''
+        Parameters
+        ----------
+            path: str | Path
+                The path to the SQLite file. It is created if it does not exist.
+
+            lease_time: float | int, default `60`
+                The time in seconds a worker owns a task without a heartbeat.
+
+            max_attempts: int, default `3`
+                The number of times a task is leased before it is marked as failed.
+        '''
+        if max_attempts < 1:
+            raise ValueError(f'Expected max_attempts to be at least 1, got {max_attempts}')
+
+        self.path: Path = Path(path)
+        self.lease_time: float | int = lease_time
+        self.max_attempts: int = max_attempts
+
+        # WAL lets readers run while another worker writes, it cannot be set inside a transaction.
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.close()
+
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    key TEXT UNIQUE NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker TEXT,
+                    lease_id TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id)')
+
+    def put(self, payloads: Iterable[Any]) -> int:
+        # the serialized payload is the key, adding the same input twice does not create duplicate work.
+        rows = [(json.dumps(payload, sort_keys=True), json.dumps(payload)) for payload in payloads]
+
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany('INSERT OR IGNORE INTO tasks (key, payload) VALUES (?, ?)', rows)
+
+            return conn.total_changes - before
+
+    def take(self, worker_id: str) -> Task | None:
+        now = time.time()
+
+        with self._connect() as conn:
+            # expired leases are returned to the queue, or failed if they ran out of attempts.
+            conn.execute('''
+                UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    error = COALESCE(error, 'lease expired')
+                WHERE status = 'leased' AND lease_expires < ?
+            ''', (self.max_attempts, now))
+
+            row = conn.execute(
+                "SELECT id, payload, attempts FROM tasks WHERE status = 'pending' ORDER BY id LIMIT 1"
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            task = Task(row[0], json.loads(row[1]), uuid.uuid4().hex, row[2] + 1)
+
+            conn.execute('''
+                UPDATE tasks SET status = 'leased', worker = ?, lease_id = ?, lease_expires = ?, attempts = ?
+                WHERE id = ?
+            ''', (worker_id, task.lease_id, now + self.lease_time, task.attempts, task.id))
+
+        return task
+
+    def heartbeat(self, task: Task) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ? WHERE id = ? AND lease_id = ? AND status = 'leased'",
+                (time.time() + self.lease_time, task.id, task.lease_id)
+            )
+
+            return cursor.rowcount == 1
+
+    def complete(self, task: Task, result: Any = None) -> bool:
+        with self._connect() as conn:
+            # an expired lease can still complete the task, as long as no other worker has taken it.
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', result = ?, error = NULL WHERE id = ? AND lease_id = ? AND status IN ('leased', 'pending', 'failed')",
+                (json.dumps(result), task.id, task.lease_id)
+            )
+
+            if cursor.rowcount == 1:
+                return True
+
+            # completing the same lease again keeps the first result.
+            row = conn.execute('SELECT status, lease_id FROM tasks WHERE id = ?', (task.id,)).fetchone()
+
+            return row is not None and row[0] == 'done' and row[1] == task.lease_id
+
+    def fail(self, task: Task, error: str = None) -> None:
+        with self._connect() as conn:
+            conn.execute('''
+                UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, error = ?
+                WHERE id = ? AND lease_id = ? AND status = 'leased'
+            ''', (self.max_attempts, error, task.id, task.lease_id))
+
+    def progress(self) -> dict[str, int]:
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+
+        with self._connect() as conn:
+            for status, count in conn.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status'):
+                counts[status] = count
+
+        return counts
+
+    def results(self) -> list[tuple[Any, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT payload, result FROM tasks WHERE status = 'done' ORDER BY id").fetchall()
+
+        return [(json.loads(payload), json.loads(result)) for payload, result in rows]
+
+    @contextmanager
+    def _connect(self):
+        '''Yields a connection inside a write transaction. A new connection is used for each call,
+        so the queue can be used by the heartbeat thread of a worker.'''
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+        try:
+            # IMMEDIATE takes the write lock up front, two workers cannot lease the same task.
+            conn.execute('BEGIN IMMEDIATE')
+
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            else:
+                conn.execute('COMMIT')
+        finally:
+            conn.close()
+
+def run_worker(queue: WorkQueue,
+               handler: Callable[[Any], Any],
+               *,
+               worker_id: str = None,
+               heartbeat_interval: float | int = None,
+               idle_exit: bool = True,
+               idle_sleep: float | int = 1) -> int:
+    '''Takes tasks from a queue and passes each payload to a handler until the queue is empty.
+    Returns the number of tasks completed by this worker.
+
+    The return value of the handler is stored as the result and must be JSON serializable.
+    If the handler raises an `Exception` or its result cannot be stored, the task is released with `fail`.
+
+    Example with a `Scraper`:
+        `run_worker(queue, lambda url: scraper.go_to(url) or scraper.get_element_attribute(elements))`
+
+    Parameters
+    ----------
+        queue: WorkQueue
+            The queue shared by the workers.
+
+        handler: Callable[[Any], Any]
+            A function that takes a payload and returns its result.
+
+        worker_id: str, default `None`
+            The name of the worker. By default it uses the host name and process ID.
+
+        heartbeat_interval: float | int, default `None`
+            The time in seconds between heartbeats while a task is running.
+            By default it is a third of the queue `lease_time`, or 20 seconds.
+
+        idle_exit: bool, default `True`
+            Return once no task is available. If `False`, the worker waits for new tasks.
+
+        idle_sleep: float | int, default `1`
+            The time in seconds to wait before checking for a task again if `idle_exit` is `False`.
+    '''
+    if worker_id is None:
+        worker_id = f'{socket.gethostname()}-{os.getpid()}'
+
+    if heartbeat_interval is None:
+        heartbeat_interval = getattr(queue, 'lease_time', 60) / 3
+
+    completed = 0
+
+    while True:
+        task = queue.take(worker_id)
+
+        if task is None:
+            if idle_exit:
+                return completed
+
+            time.sleep(idle_sleep)
+            continue
+
+        stop = threading.Event()
+
+        def _beat():
+            while not stop.wait(heartbeat_interval):
+                if not queue.heartbeat(task):
+                    break
+
+        beat_thread = threading.Thread(target=_beat, daemon=True)
+        beat_thread.start()
+
+        try:
+            result = handler(task.payload)
+
+            # complete is inside the try, a result that cannot be stored fails the task
+            # instead of stopping the worker.
+            if queue.complete(task, result):
+                completed += 1
+        except Exception as e:
+            queue.fail(task, repr(e))
+        finally:
+            stop.set()
+            beat_thread.join()